@@ -11,27 +11,73 @@ clean and makes it easy to swap out the implementation if you change
 services or add authentication later on.
 """
 
-from typing import List, Dict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Optional
 
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 # Base URL of the third‑party job listings API.  Replace this with the
 # actual service you plan to call.  The default provided here is a
 # placeholder and will not return real results without modification.
 BASE_URL = "https://jobs-api.example.com"
 
+# A single session is shared by every call to ``get_jobs`` so that the
+# underlying urllib3 pool keeps connections to ``BASE_URL`` alive between
+# searches instead of paying the TCP and TLS handshake on every request.
+# Idempotent GETs are retried a couple of times on transient gateway
+# errors before giving up.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+# Listing payloads are JSON that compresses well, so ask for compressed
+# responses.  urllib3's ``ACCEPT_ENCODING`` lists gzip/deflate plus br and
+# zstd only when the brotli / zstandard packages are importable, so we
+# never advertise an encoding we cannot decode.
+_SESSION.headers.update(
+    {
+        "Accept": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "User-Agent": "JobAppREST/1.0",
+    }
+)
 
-def get_jobs(job_title: str) -> List[Dict[str, str]]:
-    """Fetch job listings matching ``job_title`` from an external REST API.
+# Search results change slowly, so identical queries within
+# ``CACHE_TTL`` seconds are answered from process memory.  A second,
+# longer‑lived cache keeps the last good result around so that a
+# temporary upstream failure can be served stale rather than empty.
+CACHE_TTL = 300
+CACHE_MAXSIZE = 512
+_CACHE: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+_STALE_CACHE: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=2 * CACHE_TTL)
+_CACHE_LOCK = threading.RLock()
 
-    Args:
-        job_title: The job title or keywords entered by the user.
+# Queries currently being fetched.  Concurrent callers asking for the same
+# uncached query wait on the in‑flight call instead of issuing their own
+# (single‑flight), so upstream traffic scales with unique queries.
+_INFLIGHT: Dict[str, "Future[List[Dict[str, str]]]"] = {}
+
+
+def _fetch_jobs(job_title: str) -> Optional[List[Dict[str, str]]]:
+    """Call the job API for ``job_title`` and normalise the response.
 
     Returns:
-        A list of dictionaries, each representing a job posting.  Each
-        dictionary should contain at least ``title``, ``company``,
-        ``location`` and ``link`` keys.  If the API call fails or returns
-        unexpected data an empty list is returned.
+        The normalised list of jobs, or ``None`` if the request failed or
+        the API returned unexpected data.  Distinguishing failure from an
+        empty result lets ``get_jobs`` avoid caching errors.
     """
     # Compose the request URL.  Here we assume the API exposes a
     # ``/jobs`` endpoint that accepts search queries via a ``search``
@@ -41,38 +87,136 @@ def get_jobs(job_title: str) -> List[Dict[str, str]]:
     params = {"search": job_title}
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
     except Exception as exc:
         # Log the error and return no results.  In a real application
         # consider logging to a file or monitoring system instead of
         # printing to stdout.
         print(f"Error fetching jobs: {exc}")
-        return []
+        return None
 
+    # orjson parses the raw bytes directly, which is considerably faster
+    # than ``response.json()`` for large listing payloads.
     try:
-        data = response.json()
-    except ValueError:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         print("Received non‑JSON response from job API")
-        return []
+        return None
 
     # The expected structure of ``data`` depends on the API you call.  Here
     # we assume it returns a top‑level object with a ``jobs`` list, where
     # each entry is a dict containing relevant fields.  If your API
     # returns data in a different shape adjust the extraction accordingly.
+    if not isinstance(data, dict):
+        return None
     jobs = data.get("jobs")
     if not isinstance(jobs, list):
-        return []
+        return None
     # Filter each job to contain only the keys we care about and provide
     # sensible default values to avoid ``KeyError`` if a key is missing.
-    normalized: List[Dict[str, str]] = []
-    for job in jobs:
-        normalized.append(
-            {
-                "title": str(job.get("title", "N/A")),
-                "company": str(job.get("company", "")),
-                "location": str(job.get("location", "")),
-                "link": str(job.get("link", "")),
-            }
-        )
-    return normalized
+    # Entries that are not objects are skipped.  ``str`` is bound locally
+    # so the comprehension avoids a global lookup per field.
+    _s = str
+    return [
+        {
+            "title": _s(j.get("title", "N/A")),
+            "company": _s(j.get("company", "")),
+            "location": _s(j.get("location", "")),
+            "link": _s(j.get("link", "")),
+        }
+        for j in jobs
+        if isinstance(j, dict)
+    ]
+
+
+def get_jobs(job_title: str) -> List[Dict[str, str]]:
+    """Fetch job listings matching ``job_title`` from an external REST API.
+
+    Results are cached per normalised query (surrounding whitespace and
+    case are ignored) for ``CACHE_TTL`` seconds.  If the upstream call
+    fails, the last good result for the query is returned when one is
+    still held in the stale cache.  Concurrent calls for the same
+    uncached query share a single upstream request.
+
+    Args:
+        job_title: The job title or keywords entered by the user.
+
+    Returns:
+        A list of dictionaries, each representing a job posting.  Each
+        dictionary should contain at least ``title``, ``company``,
+        ``location`` and ``link`` keys.  If the API call fails or returns
+        unexpected data an empty list is returned.
+    """
+    key = job_title.strip().casefold()
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _INFLIGHT[key] = future
+    if not leader:
+        return future.result()
+
+    try:
+        jobs = _fetch_jobs(job_title)
+    except BaseException as exc:
+        with _CACHE_LOCK:
+            del _INFLIGHT[key]
+        future.set_exception(exc)
+        raise
+    # Populate the cache and retire the in‑flight entry atomically, so a
+    # later caller sees one or the other and never fetches again.
+    with _CACHE_LOCK:
+        if jobs is None:
+            result = _STALE_CACHE.get(key, [])
+        else:
+            _CACHE[key] = jobs
+            _STALE_CACHE[key] = jobs
+            result = jobs
+        del _INFLIGHT[key]
+    future.set_result(result)
+    return result
+
+
+def get_jobs_multi(queries: List[str]) -> List[Dict[str, str]]:
+    """Run several searches concurrently and merge the results.
+
+    Each query goes through ``get_jobs`` (and so through its cache and
+    single‑flight guard) on its own thread; under gevent these are
+    greenlets sharing the session's connection pool.  The wall time is
+    that of the slowest query rather than the sum.
+
+    Returns:
+        The jobs of every query in order, without repeats.  Jobs are
+        matched on ``link``, or on title, company and location when they
+        have no link.
+    """
+    if not queries:
+        return []
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        results = list(pool.map(get_jobs, queries))
+
+    seen = set()
+    merged: List[Dict[str, str]] = []
+    for jobs in results:
+        for job in jobs:
+            key = job["link"] or (job["title"], job["company"], job["location"])
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(job)
+    return merged
+
+
+def _cache_clear() -> None:
+    """Drop every cached search result."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _STALE_CACHE.clear()
+
+
+get_jobs.cache_clear = _cache_clear  # type: ignore[attr-defined]
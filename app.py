@@ -12,21 +12,95 @@ Routes:
     /apply       – Persist a selected job application to the database.
     /applications – Display all saved job applications.
 
-To run the application locally install dependencies from
-``requirements.txt`` and set up a MongoDB instance.  You can override
-the MongoDB URI via the ``MONGO_URI`` environment variable.  When run
-with ``debug=True`` changes will be reloaded automatically.
+JSON API:
+    GET   /api/applications      – Page through applications, or with
+                                   ``Accept: text/event-stream`` receive a
+                                   snapshot followed by live changes (SSE).
+    POST  /api/applications      – Create an application.
+    PATCH /api/applications/<id> – Update an application's status.
+
+To run the application install dependencies from ``requirements.txt``
+and set up a MongoDB instance.  You can override the MongoDB URI via the
+``MONGO_URI`` environment variable.  Serve it with gunicorn and gevent
+workers::
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+For local development with automatic reloading use
+``FLASK_APP=app FLASK_DEBUG=1 flask run`` instead.
 """
 
-from flask import Flask, render_template, request, redirect, url_for
+import functools
+import os
+import queue
 
-from api_client import get_jobs
-from flask import Flask, jsonify, request
+import orjson
 from bson import ObjectId
-from database import connect, add_application, list_applications, update_application_status
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
+
+from api_client import get_jobs_multi
+from database import (
+    connect,
+    add_application,
+    list_applications,
+    subscribe_applications,
+    unsubscribe_applications,
+    update_application_status,
+)
 
 app = Flask(__name__)
 
+# Jinja keeps compiled templates in an LRU cache; size it for every
+# template we ship.  Template auto-reload is left at Flask's default,
+# which only re-checks template files in debug mode.
+app.jinja_options = {**app.jinja_options, "cache_size": 400}
+# Static files may be cached by browsers for a year; ``_static_version``
+# adds the file's mtime to static URLs so an edited file gets a new URL.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
+
+# How long browsers may reuse the /applications page.  The page is a
+# static shell that loads its data from the API, so this is safe.
+APPLICATIONS_PAGE_MAX_AGE = 60
+
+
+def _file_version(filename: str):
+    """Return the static file's mtime as an int, or ``None`` if missing."""
+    try:
+        return int(os.stat(os.path.join(app.static_folder, filename)).st_mtime)
+    except OSError:
+        return None
+
+
+# Assets only change on deploy, so stat each file once per process.  In
+# debug mode the uncached version is used so edits show up immediately.
+_cached_file_version = functools.lru_cache(maxsize=None)(_file_version)
+
+
+@app.url_defaults
+def _static_version(endpoint, values):
+    if endpoint == "static" and "filename" in values:
+        lookup = _file_version if app.debug else _cached_file_version
+        version = lookup(values["filename"])
+        if version is not None:
+            values["v"] = version
+
+
+@app.after_request
+def _cache_headers(response):
+    if request.endpoint == "applications" and response.status_code == 200:
+        response.cache_control.public = True
+        response.cache_control.max_age = APPLICATIONS_PAGE_MAX_AGE
+    return response
+
 
 @app.route('/')
 def index() -> str:
@@ -40,12 +114,13 @@ def submit() -> str:
 
     Extracts the job title from the submitted form, calls the REST API
     to fetch matching job postings and renders the result page with the
-    returned data.
+    returned data.  The plain title and a remote variant are searched
+    concurrently and merged.
     """
     job_title = request.form.get('jobTitle', '').strip()
-    # Fetch jobs from the external API.  If the API call fails or no
+    # Fetch jobs from the external API.  If the API calls fail or no
     # results are found ``jobs`` will be an empty list.
-    jobs = get_jobs(job_title) if job_title else []
+    jobs = get_jobs_multi([job_title, f"{job_title} remote"]) if job_title else []
     return render_template('result.html', results=jobs, search_query=job_title)
 
 
@@ -65,7 +140,9 @@ def apply() -> str:
         # Store a default status of 'applied' or use the provided status
         'status': request.form.get('status', 'applied')
     }
-    add_application(application_data)
+    # Wait for the write (at most one batching window) so a failure is
+    # not silently dropped and the dashboard we redirect to includes it.
+    add_application(connect(), application_data)
     return redirect(url_for('applications'))
 
 
@@ -74,15 +151,81 @@ def applications() -> str:
 
     return render_template('applications.html')
 
-def _to_json(doc):
-    doc["_id"] = str(doc["_id"])
-    return doc
+# Page size bounds for ``GET /api/applications``.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Idle seconds between SSE keep-alive comments.
+SSE_KEEPALIVE_S = 15
+
+def _sse(data, event=None) -> str:
+    """Format one Server-Sent Event carrying ``data`` as JSON."""
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {orjson.dumps(data).decode()}\n\n"
+
+def _stream_applications() -> Response:
+    """Stream every application, then each change as it happens.
+
+    Events: ``snapshot`` carries a page of applications, the default
+    ``message`` event carries one inserted or updated application and
+    ``end`` means live updates are unavailable (MongoDB is not a replica
+    set), so the client should stop reconnecting.  Changes come from the
+    process-wide change stream via ``subscribe_applications``.
+    """
+    coll = connect()
+
+    def gen():
+        # Subscribe before reading the snapshot so no change made in
+        # between is missed; the client merges duplicates by _id.
+        changes = subscribe_applications(coll)
+        try:
+            # Keyset paging: each page seeks past the previous page's last
+            # row, so a reconnect costs one pass over the index.
+            after = None
+            while True:
+                batch = list_applications(coll, limit=MAX_PAGE_SIZE, after=after)
+                if batch:
+                    yield _sse(batch, "snapshot")
+                if len(batch) < MAX_PAGE_SIZE:
+                    break
+                last = batch[-1]
+                after = (last.get("date"), last["_id"])
+            if changes is None:
+                yield _sse(None, "end")
+                return
+            while True:
+                try:
+                    doc = changes.get(timeout=SSE_KEEPALIVE_S)
+                except queue.Empty:
+                    # Comment line: keeps proxies from timing out and lets
+                    # us notice a disconnected client.
+                    yield ": keep-alive\n\n"
+                    continue
+                if doc is None:
+                    # Fell behind; closing makes the browser reconnect and
+                    # receive a fresh snapshot.
+                    return
+                yield _sse(doc)
+        finally:
+            if changes is not None:
+                unsubscribe_applications(changes)
+
+    return Response(
+        stream_with_context(gen()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @app.get("/api/applications")
 def api_list_apps():
+    if request.accept_mimetypes.best == "text/event-stream":
+        return _stream_applications()
+    page = max(request.args.get("page", 1, type=int), 1)
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
     coll = connect()
-    apps = list_applications(coll)
-    return jsonify([_to_json(a) for a in apps])
+    apps = list_applications(coll, skip=(page - 1) * limit, limit=limit)
+    # Serialise with orjson rather than Flask's stdlib-based encoder.
+    return app.response_class(orjson.dumps(apps), mimetype="application/json")
 
 @app.post("/api/applications")
 def api_add_app():
@@ -94,8 +237,10 @@ def api_add_app():
         "status":  data.get("status", "wishlist"),
         "date":    data.get("date"),
     }
+    # ``?fast=1`` opts into an unacknowledged (w=0) insert.
+    fast = request.args.get("fast", "").lower() in ("1", "true", "yes")
     coll = connect()
-    new_id = add_application(coll, payload)  # should return inserted_id
+    new_id = add_application(coll, payload, fast=fast)
     payload["_id"] = str(new_id)
     return jsonify(payload), 201
 
@@ -108,6 +253,3 @@ def api_update_status(id):
     coll = connect()
     ok = update_application_status(coll, ObjectId(id), status)
     return jsonify({"ok": bool(ok)})
-
-if __name__ == '__main__':
-    app.run(debug=True)
@@ -7,11 +7,19 @@ technology or add additional operations without cluttering the Flask
 application code.
 """
 
-from typing import Dict, List
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Tuple
 import os
+import queue
+import threading
+import time
 
-from pymongo import MongoClient
+from bson import ObjectId
+from pymongo import InsertOne, MongoClient, UpdateOne
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
+from pymongo.write_concern import WriteConcern
 
 # Connection settings.  The MongoDB URI can be overridden via the
 # ``MONGO_URI`` environment variable to point at a different
@@ -22,51 +30,514 @@ MONGO_URI = os.environ.get("MONGO_URI", "mongodb://localhost:27017/")
 # Database and collection names.  Adjust these names as appropriate
 # for your environment.  Keeping names in variables instead of inline
 # strings makes them easier to update and reuse.
-DB_NAME = os.environ.get("JOBAPP_DB_NAME", "job_app")
-COLLECTION_NAME = os.environ.get("JOBAPP_COLLECTION", "applications")
+DB_NAME = os.environ.get("DB_NAME", "jobapp")
+COLLECTION_NAME = os.environ.get("COLLECTION_NAME", "applications")
 
-# Establish the client and collection once at import time.  In a
-# real‑world application you may want to handle connection errors
-# gracefully or lazily connect on first use.  Here we assume that
-# MongoDB is available when the module is imported.
-client = MongoClient(MONGO_URI)
-db = client[DB_NAME]
-collection: Collection = db[COLLECTION_NAME]
+# The client is created lazily on first use and re‑created in a forked
+# child (for example a gunicorn worker), because pymongo's background
+# monitoring threads do not survive ``fork``.  The pool is sized for the
+# number of concurrent requests a single worker process serves.
+_client: Optional[MongoClient] = None
+_pid: Optional[int] = None
+_lock = threading.Lock()
+# Pid of the process whose indexes have been created; see ``_ensure_indexes``.
+_index_lock = threading.Lock()
+_indexed_pid: Optional[int] = None
 
+# Inserts arriving close together are coalesced into one unordered
+# ``bulk_write``.  The request that fills the buffer to ``BATCH_MAX``
+# flushes it inline; otherwise a per‑process flusher thread writes
+# whatever is pending ``BATCH_MAX_WAIT_MS`` after the first item arrived.
+BATCH_MAX = 32
+BATCH_MAX_WAIT_MS = 20
+# Upper bound on how long ``add_application`` waits for its write.
+WRITE_TIMEOUT_S = 30
 
+_PendingWrite = Tuple[Collection, Dict, bool, Future]
+_pending: Deque[_PendingWrite] = deque()
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
+# Pid of the process whose flusher thread is running; see ``_ensure_flusher``.
+_flusher_pid: Optional[int] = None
+_flusher_lock = threading.Lock()
 
-def get_all_applications() -> List[Dict[str, str]]:
-    """Retrieve all job application documents from MongoDB.
+# Server error code for a unique index violation.
+DUPLICATE_KEY = 11000
+
+# Live dashboard updates.  Each process runs a single change stream and
+# fans its events out to one bounded queue per connected client, so the
+# number of open dashboards does not tie up pooled connections.  A queue
+# that overflows is dropped and sent ``None`` so its client resyncs.
+SUBSCRIBER_QUEUE_MAX = 1000
+# How long ``subscribe_applications`` waits for the stream to open.
+WATCH_READY_TIMEOUT_S = 5
+# Server error code when change streams need a replica set.
+CHANGE_STREAM_UNSUPPORTED = 40573
+# Backoff bounds for reopening a failed change stream.
+WATCH_RETRY_MIN_S = 1
+WATCH_RETRY_MAX_S = 30
+
+_subscribers: set = set()
+_subscribers_lock = threading.Lock()
+_watch_lock = threading.Lock()
+_watch_ready = threading.Event()
+_watch_pid: Optional[int] = None
+# ``None`` until the stream has opened or failed, then True / False.
+_changes_available: Optional[bool] = None
+
+# Write concern for fire‑and‑forget writes; see ``update_application_status``.
+_UNACKNOWLEDGED = WriteConcern(w=0)
+
+# Only the fields the dashboard renders are fetched from the server.
+APPLICATION_FIELDS = {
+    "title": 1,
+    "company": 1,
+    "location": 1,
+    "link": 1,
+    "url": 1,
+    "status": 1,
+    "date": 1,
+}
+
+
+def get_all_applications(skip: int = 0, limit: int = 50) -> List[Dict[str, str]]:
+    """Retrieve one page of job application documents from MongoDB.
+
+    Args:
+        skip: Number of documents to skip (newest first).
+        limit: Maximum number of documents to return.
 
     Returns:
         A list of dictionaries representing the stored job
-        applications.  MongoDB returns documents with an ``_id`` field
-        of type ``ObjectId``; we convert these IDs to strings for
-        easier rendering in templates.
+        applications.  The ``_id`` of each document is returned as a
+        string for easier rendering in templates.
+    """
+    return list_applications(connect(), skip=skip, limit=limit)
+
+
+def connect() -> Collection:
+    """Return the applications collection, connecting on first use.
+
+    The shared ``MongoClient`` is created once per process; the check is
+    repeated under the lock so concurrent first calls build only one.
+    ``_client`` is only published once the client is fully set up.
+    """
+    global _client, _pid, _index_lock, _indexed_pid
+    if _client is None or os.getpid() != _pid:
+        with _lock:
+            if _client is None or os.getpid() != _pid:
+                # Wire compression falls back to zlib when the optional
+                # zstandard / python-snappy packages are not installed.
+                client = MongoClient(
+                    MONGO_URI,
+                    maxPoolSize=64,
+                    minPoolSize=8,
+                    socketTimeoutMS=5000,
+                    serverSelectionTimeoutMS=3000,
+                    compressors="zstd,snappy,zlib",
+                    retryWrites=True,
+                )
+                _index_lock = threading.Lock()
+                _indexed_pid = None
+                _client = client
+                _pid = os.getpid()
+    coll = _client[DB_NAME][COLLECTION_NAME]
+    if _indexed_pid != _pid:
+        _ensure_indexes(coll)
+    return coll
+
+
+def _ensure_indexes(coll: Collection) -> None:
+    """Create the collection's indexes once per process.
+
+    A connection error is logged and the step is retried on a later
+    ``connect`` call, so a briefly unavailable server does not leave the
+    process without its indexes.  Only one thread attempts it at a time;
+    the others carry on without waiting.
+    """
+    global _indexed_pid
+    if not _index_lock.acquire(blocking=False):
+        return
+    try:
+        if _indexed_pid == os.getpid():
+            return
+        # Listing sorts newest first (``_id`` breaks ties), so keep
+        # that order in an index.
+        coll.create_index([("date", -1), ("_id", -1)])
+        # One application per job posting.  Documents without a usable
+        # link are left out of the index.
+        try:
+            coll.create_index(
+                [("link", 1)],
+                unique=True,
+                partialFilterExpression={
+                    "link": {"$type": "string", "$gt": ""}
+                },
+            )
+        except OperationFailure as exc:
+            # Most likely existing duplicates, which a retry won't fix;
+            # inserts still work.
+            print(f"Could not create unique index on link: {exc}")
+        _indexed_pid = os.getpid()
+    except PyMongoError as exc:
+        print(f"Could not create indexes, will retry: {exc}")
+    finally:
+        _index_lock.release()
+
+def _take_pending() -> List[_PendingWrite]:
+    """Empty the buffer and return its contents.  Caller holds the lock."""
+    batch = list(_pending)
+    _pending.clear()
+    _pending_event.clear()
+    return batch
+
+
+def _write_op(doc: Dict):
+    """Upsert on ``link`` when the document has one, otherwise insert."""
+    link = doc.get("link")
+    if isinstance(link, str) and link:
+        return UpdateOne({"link": link}, {"$setOnInsert": doc}, upsert=True)
+    # ``InsertOne`` assigns a missing ``_id`` to the document in place,
+    # so the id is known client‑side even for unacknowledged writes.
+    return InsertOne(doc)
+
+
+def _flush_group(
+    coll: Collection, fast: bool, docs: List[Dict], futures: List[Future]
+) -> None:
+    """Write one group with a single ``bulk_write`` and resolve its futures."""
+    ops = [_write_op(doc) for doc in docs]
+    upserted: Dict[int, Any] = {}
+    failed: Dict[int, Exception] = {}
+    try:
+        res = coll.bulk_write(ops, ordered=False)
+        if res.acknowledged:
+            upserted = res.upserted_ids
+    except BulkWriteError as exc:
+        # Unordered: only the listed operations failed.
+        upserted = {
+            u["index"]: u["_id"] for u in exc.details.get("upserted", [])
+        }
+        for error in exc.details.get("writeErrors", []):
+            i = error["index"]
+            # Two upserts of the same link raced; the document exists.
+            if error.get("code") == DUPLICATE_KEY and isinstance(
+                ops[i], UpdateOne
+            ):
+                continue
+            failed[i] = BulkWriteError({"writeErrors": [error]})
+    for i, (doc, op, fut) in enumerate(zip(docs, ops, futures)):
+        if i in failed:
+            fut.set_exception(failed[i])
+        elif isinstance(op, InsertOne):
+            fut.set_result(doc["_id"])
+        elif i in upserted:
+            fut.set_result(upserted[i])
+        elif fast:
+            # Unacknowledged: whether it matched or upserted is unknown.
+            fut.set_result(None)
+        else:
+            existing = coll.find_one({"link": doc["link"]}, {"_id": 1})
+            fut.set_result(existing["_id"] if existing else None)
+
+
+def _flush(batch: List[_PendingWrite]) -> None:
+    """Write ``batch`` with one ``bulk_write`` per collection and write mode.
+
+    Never raises: any error is set on every future in the affected group
+    that is not resolved yet, so no caller is left waiting.
+    """
+    groups: Dict[
+        Tuple[str, bool], Tuple[Collection, List[Dict], List[Future]]
+    ] = {}
+    try:
+        for coll, doc, fast, fut in batch:
+            if fast:
+                coll = coll.with_options(write_concern=_UNACKNOWLEDGED)
+            group = groups.setdefault((coll.full_name, fast), (coll, [], []))
+            group[1].append(doc)
+            group[2].append(fut)
+    except Exception as exc:
+        _fail_pending([fut for _, _, _, fut in batch], exc)
+        return
+    for (_, fast), (coll, docs, futures) in groups.items():
+        try:
+            _flush_group(coll, fast, docs, futures)
+        except Exception as exc:
+            _fail_pending(futures, exc)
+
+
+def _fail_pending(futures: List[Future], exc: Exception) -> None:
+    for fut in futures:
+        if not fut.done():
+            fut.set_exception(exc)
+
+
+def _flusher_loop() -> None:
+    while True:
+        _pending_event.wait()
+        time.sleep(BATCH_MAX_WAIT_MS / 1000)
+        try:
+            with _pending_lock:
+                batch = _take_pending()
+            if batch:
+                _flush(batch)
+        except Exception as exc:
+            # Keep the thread alive; a dead flusher would block every
+            # later ``add_application`` in this process.
+            print(f"Error flushing application writes: {exc}")
+
+
+def _ensure_flusher() -> None:
+    """Start this process's flusher thread with a fresh buffer, once.
+
+    Keyed on the pid so a forked child never inherits the parent's
+    buffer, locks or (dead) thread.
+    """
+    global _pending, _pending_lock, _pending_event, _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _pending = deque()
+        _pending_lock = threading.Lock()
+        _pending_event = threading.Event()
+        threading.Thread(
+            target=_flusher_loop, name="mongo-flusher", daemon=True
+        ).start()
+        _flusher_pid = os.getpid()
+
+
+def add_application(coll, doc: Dict, wait: bool = True, fast: bool = False):
+    """Buffer ``doc`` for insertion into ``coll``.
+
+    A document with a non‑empty ``link`` is upserted on that link, so
+    saving the same posting twice is a no‑op that returns the existing
+    ``_id``.
+
+    Args:
+        coll: The collection to insert into, as returned by ``connect``.
+        doc: The application document.
+        wait: When true, block until the batch containing ``doc`` has been
+            written and return its ``_id`` (``None`` for a fast upsert,
+            whose outcome is not reported).  When false, return ``None``
+            immediately (fire‑and‑forget).
+        fast: Write with ``w=0`` instead of waiting for the server to
+            acknowledge the insert.  Failures on the server go unnoticed.
+    """
+    _ensure_flusher()
+    fut: Future = Future()
+    batch = None
+    with _pending_lock:
+        _pending.append((coll, doc, fast, fut))
+        if len(_pending) == 1:
+            _pending_event.set()
+        elif len(_pending) >= BATCH_MAX:
+            batch = _take_pending()
+    if batch:
+        _flush(batch)
+    if not wait:
+        return None
+    return fut.result(timeout=WRITE_TIMEOUT_S)
+
+def _after_filter(after: Tuple[Any, str]) -> Dict:
+    """Match rows that sort after ``after`` in (date desc, _id desc) order.
+
+    ``after`` is the ``(date, _id)`` of the last row already returned.
+    Rows with no ``date`` sort last, so they always follow a dated row.
+    Dates are compared within their BSON type; the app stores them as
+    ISO strings.
+    """
+    date, last_id = after
+    last_id = ObjectId(last_id)
+    if date is None:
+        return {"date": None, "_id": {"$lt": last_id}}
+    return {
+        "$or": [
+            {"date": {"$lt": date}},
+            {"date": date, "_id": {"$lt": last_id}},
+            {"date": None},
+        ]
+    }
+
+
+def list_applications(
+    coll,
+    skip: int = 0,
+    limit: int = 50,
+    after: Optional[Tuple[Any, str]] = None,
+) -> List[Dict]:
+    """Return one page of applications, newest first, with ``_id`` as str.
+
+    Pages are addressed either by ``skip`` or, for walking the whole
+    collection, by ``after``: the ``(date, _id)`` of the previous page's
+    last row.  The latter seeks on the (date, _id) index instead of
+    re-scanning every skipped row.
+
+    The ``ObjectId`` to string conversion happens on the server
+    (``$toString``, MongoDB 4.0+), so documents need no post‑processing.
+    """
+    pipeline: List[Dict] = []
+    if after is not None:
+        pipeline.append({"$match": _after_filter(after)})
+    pipeline += [
+        # ``date`` is not unique (and missing on /apply documents), so
+        # ``_id`` makes the order total and pages stable.
+        {"$sort": {"date": -1, "_id": -1}},
+        {"$skip": skip},
+        {"$limit": limit},
+        {"$project": {**APPLICATION_FIELDS, "_id": {"$toString": "$_id"}}},
+    ]
+    cursor = coll.aggregate(pipeline, batchSize=200)
+    return list(cursor)
+
+def watch_applications(coll, resume_after=None, max_await_ms: int = 15000):
+    """Open a change stream of inserted, updated and replaced applications.
+
+    Requires a replica set or sharded cluster; on a standalone server this
+    raises ``OperationFailure``.  ``resume_after`` continues from a previous
+    stream's resume token so no change is missed across a reconnect.
+    """
+    return coll.watch(
+        [{"$match": {"operationType": {"$in": ["insert", "update", "replace"]}}}],
+        full_document="updateLookup",
+        resume_after=resume_after,
+        max_await_time_ms=max_await_ms,
+    )
+
+
+def _drop_subscriber(q: queue.Queue) -> None:
+    """Unregister ``q`` and leave it only ``None`` so its client resyncs.
+
+    Caller holds ``_subscribers_lock``.
     """
-    docs = []
-    for doc in collection.find():
-        # Convert ObjectId to string and remove the internal field
-        doc["_id"] = str(doc["_id"])
-        docs.append(doc)
-    return docs
+    _subscribers.discard(q)
+    with q.mutex:
+        q.queue.clear()
+    q.put_nowait(None)
+
+
+def _publish(doc: Dict) -> None:
+    with _subscribers_lock:
+        for q in list(_subscribers):
+            try:
+                q.put_nowait(doc)
+            except queue.Full:
+                # The client fell behind.
+                _drop_subscriber(q)
 
 
-def _client():
-    uri = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
-    return MongoClient(uri, serverSelectionTimeoutMS=20000)
+def _resync_all() -> None:
+    """Tell every client to reconnect and take a fresh snapshot."""
+    with _subscribers_lock:
+        for q in list(_subscribers):
+            _drop_subscriber(q)
 
-def connect():
-    dbname = os.getenv("DB_NAME", "jobapp")
-    collname = os.getenv("COLLECTION_NAME", "applications")
-    return _client()[dbname][collname]
 
-def add_application(coll, doc: Dict):
-    res = coll.insert_one(doc)
-    return res.inserted_id
+def _watch_loop(coll: Collection) -> None:
+    """Follow the change stream for this process, reopening it on errors.
+
+    Only a server without change stream support stops the loop.  Other
+    failures are retried with exponential backoff; when the stream cannot
+    be resumed, clients are told to resync because changes may have been
+    missed.
+    """
+    global _changes_available
+    resume_token = None
+    delay = WATCH_RETRY_MIN_S
+    while True:
+        try:
+            with watch_applications(coll, resume_after=resume_token) as stream:
+                if resume_token is None:
+                    # A fresh stream cannot replay what happened before it
+                    # opened, so earlier subscribers' snapshots may be stale.
+                    _resync_all()
+                _changes_available = True
+                _watch_ready.set()
+                delay = WATCH_RETRY_MIN_S
+                for change in stream:
+                    resume_token = stream.resume_token
+                    doc = application_from_change(change)
+                    if doc is not None:
+                        _publish(doc)
+        except OperationFailure as exc:
+            if exc.code == CHANGE_STREAM_UNSUPPORTED:
+                print(f"Live application updates unavailable: {exc}")
+                _changes_available = False
+                _watch_ready.set()
+                _resync_all()
+                return
+            # pymongo already retried resumable errors, so this one (e.g.
+            # ChangeStreamHistoryLost) would fail again with the same token.
+            print(f"Change stream failed, restarting: {exc}")
+            resume_token = None
+            _resync_all()
+        except PyMongoError as exc:
+            print(f"Change stream failed, reopening: {exc}")
+        time.sleep(delay)
+        delay = min(delay * 2, WATCH_RETRY_MAX_S)
 
-def list_applications(coll) -> List[Dict]:
-    return list(coll.find().sort("date", -1))
 
-def update_application_status(coll, _id, status: str):
-    return coll.update_one({"_id": _id}, {"$set": {"status": status}}).modified_count
\ No newline at end of file
+def _ensure_watcher(coll: Collection) -> None:
+    global _watch_pid, _subscribers, _watch_ready, _changes_available
+    if _watch_pid == os.getpid():
+        return
+    with _watch_lock:
+        if _watch_pid == os.getpid():
+            return
+        # Fresh state in a forked child; the parent's thread is gone.
+        _subscribers = set()
+        _watch_ready = threading.Event()
+        _changes_available = None
+        threading.Thread(
+            target=_watch_loop, args=(coll,), name="mongo-watcher", daemon=True
+        ).start()
+        _watch_pid = os.getpid()
+
+
+def subscribe_applications(coll) -> "Optional[queue.Queue]":
+    """Register for live application changes from this process's stream.
+
+    Returns a queue that receives each changed application (as shaped by
+    ``application_from_change``) and ``None`` if the subscriber fell too
+    far behind, or returns ``None`` when change streams are unavailable.
+    Pass the queue to ``unsubscribe_applications`` when done.
+    """
+    _ensure_watcher(coll)
+    _watch_ready.wait(WATCH_READY_TIMEOUT_S)
+    if _changes_available is False:
+        return None
+    q: queue.Queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_MAX)
+    with _subscribers_lock:
+        _subscribers.add(q)
+    return q
+
+
+def unsubscribe_applications(q: queue.Queue) -> None:
+    with _subscribers_lock:
+        _subscribers.discard(q)
+
+
+def application_from_change(change: Dict) -> Optional[Dict]:
+    """Shape a change event's full document like ``list_applications`` rows."""
+    doc = change.get("fullDocument")
+    if doc is None:
+        # Updated and then deleted before the lookup ran.
+        return None
+    out = {k: doc[k] for k in APPLICATION_FIELDS if k in doc}
+    out["_id"] = str(doc["_id"])
+    return out
+
+
+def update_application_status(coll, _id, status: str) -> bool:
+    """Set the status of application ``_id`` without waiting for an ack.
+
+    A status change from the dashboard is a cheap, idempotent UI action,
+    so it is sent with ``w=0``: the call returns once the update is on the
+    wire.  The trade‑off is that a failed or non‑matching update is not
+    reported, hence the unconditional ``True``.
+    """
+    fast = coll.with_options(write_concern=_UNACKNOWLEDGED)
+    fast.update_one({"_id": _id}, {"$set": {"status": status}})
+    return True
@@ -0,0 +1,19 @@
+"""
+gunicorn.conf.py
+Production server settings for the JobApp project.  Run with::
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Requests spend most of their time waiting on MongoDB and the job API, so
+gevent workers are used to overlap that I/O within each process.  The
+application is not preloaded: each worker imports it after ``fork`` and
+``database.connect`` creates that worker's own MongoClient on first use.
+"""
+
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+worker_connections = 1000
+keepalive = 5
@@ -0,0 +1,94 @@
+"""
+test_database.py
+Tests for the write batcher in ``database.py``.  A fake collection stands
+in for MongoDB so the batching and error handling can be exercised
+without a running server.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from bson import ObjectId
+from pymongo.errors import AutoReconnect
+from pymongo.results import BulkWriteResult
+
+import database
+
+# Generous bound so a hung future fails the test instead of the run.
+RESULT_TIMEOUT = 5
+
+
+class FakeCollection:
+    """Just enough of ``Collection`` for ``database._flush``."""
+
+    full_name = "jobapp.applications"
+
+    def __init__(self, bulk_error=None, find_error=None, upsert=True):
+        self.bulk_error = bulk_error
+        self.find_error = find_error
+        self.upsert = upsert
+
+    def with_options(self, **kwargs):
+        return self
+
+    def bulk_write(self, ops, ordered):
+        if self.bulk_error is not None:
+            raise self.bulk_error
+        upserted = []
+        for i, op in enumerate(ops):
+            if hasattr(op, "_filter"):
+                if self.upsert:
+                    upserted.append({"index": i, "_id": ObjectId()})
+            else:
+                op._doc.setdefault("_id", ObjectId())
+        return BulkWriteResult({"upserted": upserted}, True)
+
+    def find_one(self, filter, projection=None):
+        if self.find_error is not None:
+            raise self.find_error
+        return {"_id": ObjectId()}
+
+
+class BatcherTest(unittest.TestCase):
+    def test_insert_returns_id(self):
+        # No ``connect()`` first: the flusher starts on demand.
+        coll = FakeCollection()
+        doc = {"title": "Engineer", "link": ""}
+        inserted_id = database.add_application(coll, doc)
+        self.assertEqual(inserted_id, doc["_id"])
+
+    def test_bulk_write_error_fails_every_caller(self):
+        coll = FakeCollection(bulk_error=AutoReconnect("down"))
+        with self.assertRaises(AutoReconnect):
+            database.add_application(coll, {"title": "Engineer"})
+
+    def test_find_one_error_does_not_kill_flusher(self):
+        coll = FakeCollection(find_error=AutoReconnect("down"), upsert=False)
+        with self.assertRaises(AutoReconnect):
+            database.add_application(coll, {"link": "https://a.example"})
+        # The flusher survived: the next write in this process completes.
+        doc = {"title": "Engineer"}
+        inserted_id = database.add_application(FakeCollection(), doc)
+        self.assertEqual(inserted_id, doc["_id"])
+
+    def test_flush_error_resolves_whole_batch(self):
+        coll = FakeCollection(find_error=AutoReconnect("down"), upsert=False)
+        errors = []
+
+        def apply(i):
+            try:
+                database.add_application(coll, {"link": f"https://{i}.example"})
+            except Exception as exc:
+                errors.append(exc)
+
+        # Enough concurrent callers to fill the buffer and flush inline.
+        pool = ThreadPoolExecutor(max_workers=database.BATCH_MAX)
+        futures = [pool.submit(apply, i) for i in range(database.BATCH_MAX)]
+        pool.shutdown(wait=False)
+        _, not_done = wait(futures, timeout=RESULT_TIMEOUT)
+        self.assertFalse(not_done, "caller left waiting after a failed flush")
+        self.assertEqual(len(errors), database.BATCH_MAX)
+        self.assertTrue(all(isinstance(e, AutoReconnect) for e in errors))
+
+if __name__ == "__main__":
+    unittest.main()
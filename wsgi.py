@@ -0,0 +1,16 @@
+"""
+wsgi.py
+WSGI entry point used by gunicorn (see ``gunicorn.conf.py``).
+
+gevent's monkey patching must run before ``requests``, ``pymongo`` or
+``threading`` are imported so that their sockets and locks cooperate
+with the event loop, hence it happens here ahead of importing the app.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import app  # noqa: E402
+
+__all__ = ["app"]